@@ -6,37 +6,69 @@ Upgrades (clean + robust):
 - Works with many sites.yml shapes (list/dict/strings) via normalization
 - Per-site numbered output: "[i/N] [ STATUS ] (ms) Site: URL"
 - Retries & timeouts, rotating headers from headers.yml
-- Per-domain concurrency limit + jitter, proxy support (http/socks)
+- Per-domain concurrency limit + request pacing, proxy support (http/socks)
 - Site filtering (--only, case-insensitive), bulk usernames (--userlist)
 - Export positives to JSONL/CSV
 - Optional evidence-only mode (--evidence-only) using sites.yml -> evidence_regex
 - Backward compatible placeholders: {!!} and {user}
-- NEW: --links-out streams positive URLs immediately (flush + fsync, de-duplicated)
+- NEW: --links-out streams positive URLs immediately (line-buffered, periodic fsync, de-duplicated)
 - DEFAULTS: --links-out hits.txt and evidence-only mode enabled (can override with --any-200)
 - NEW: Interactive prompt for usernames if not provided on CLI
 - NEW: Prints an on-screen "How to use" guide
 - NEW: Ordered console output while preserving concurrency
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from time import perf_counter
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
+from urllib.request import getproxies, proxy_bypass
+from http.cookies import CookieError, SimpleCookie
+from email.utils import parsedate_to_datetime
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import argparse
+import functools
+import hashlib
 import random
 import sys
 import os
+import pickle
 import time
 import json
 import csv
+import io
+import itertools
 import re
 import threading
 
-import requests
-from requests.adapters import HTTPAdapter
+import urllib3
 from urllib3.util.retry import Retry
-from yaml import safe_load, safe_dump
+from yaml import load as yaml_load, safe_dump
+
+try:  # libyaml C parser is far faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:  # optional: Mozilla CA bundle, as requests used
+    import certifi
+except ImportError:
+    certifi = None
+
+try:  # optional: HTTP/2 transport (--http2)
+    import httpx
+except ImportError:
+    httpx = None
+
+try:  # optional: multi-pattern evidence matching
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:  # optional: faster JSONL export
+    import orjson
+except ImportError:
+    orjson = None
 
 # -----------------------
 # Banner
@@ -79,14 +111,54 @@ def print_howto():
 def _abs_here(relpath: str) -> str:
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), relpath)
 
-def load_yaml(relpath: str) -> Any:
+def _yaml_cache_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".pkl"
+
+def _read_yaml_cache(path: str, st: os.stat_result) -> Tuple[bool, Any]:
+    try:
+        with open(_yaml_cache_path(path), "rb") as f:
+            cached = pickle.load(f)
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return True, cached["data"]
+    except Exception:
+        pass
+    return False, None
+
+def _write_yaml_cache(path: str, st: os.stat_result, data: Any):
+    cache_path = _yaml_cache_path(path)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def load_yaml(relpath: str, cache: bool = False) -> Any:
+    """
+    Parse a YAML file next to this script. With cache=True the parsed data
+    is also pickled to a '.pkl' sidecar and reused while the YAML file's
+    mtime and size are unchanged.
+    """
     path = _abs_here(relpath)
     try:
+        st = os.stat(path)
+        if cache:
+            hit, data = _read_yaml_cache(path, st)
+            if hit:
+                return data
         with open(path, "r", encoding="utf8") as f:
-            return safe_load(f.read())
+            data = yaml_load(f.read(), Loader=YamlLoader)
     except Exception as e:
         print(f"Error, could not read {relpath}: {e}")
         sys.exit(1)
+    if cache:
+        _write_yaml_cache(path, st, data)
+    return data
 
 def normalize_sites(raw: Any) -> List[Dict[str, Any]]:
     """
@@ -126,9 +198,150 @@ def normalize_sites(raw: Any) -> List[Dict[str, Any]]:
     else:
         print("sites.yml format not recognized. Use list/dict.")
         sys.exit(1)
+    for d in out:
+        _prepare_url(d)
+        _prepare_evidence(d)
     return out
 
-_sites_raw = load_yaml("sites.yml")
+_EV_FLAGS = re.I | re.M
+_USER_PLACEHOLDERS = ("{user}", "{!!}")
+
+def _prepare_url(site: Dict[str, Any]):
+    """
+    Precompute how a username is placed into the URL: a str.format template
+    ('_fmt') for {!!}/{user}, or the finished URL ('_url_static') if the
+    template has no placeholder. The host ('_netloc') only depends on the
+    template, so it is parsed here once; a templated host such as
+    {!!}.wordpress.com is rate-limited as one site.
+    """
+    url = str(site["url"])
+    site["_netloc"] = urlparse(url).netloc or url
+    if not any(ph in url for ph in _USER_PLACEHOLDERS):
+        site["_url_static"] = url
+        site["_fmt"] = None
+        return
+    fmt = url.replace("{", "{{").replace("}", "}}")
+    site["_url_static"] = None
+    site["_fmt"] = fmt.replace("{{!!}}", "{0}").replace("{{user}}", "{0}")
+
+class _HsMatcher:
+    """
+    A site's evidence patterns compiled into one Hyperscan database;
+    search() returns whether any pattern matches. Hyperscan follows PCRE
+    semantics, which only approximate re.I|re.M; patterns using constructs
+    that mean something else in Python re (see _HS_DIVERGENT) are kept on
+    the re path. Scratch space is not thread-safe, so each worker thread
+    gets its own.
+    """
+    def __init__(self, patterns: List[str]):
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+                 | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        self.patterns = patterns
+        self._db = hyperscan.Database()
+        self._db.compile(expressions=[p.encode("utf-8") for p in patterns], ids=list(range(len(patterns))),
+                         elements=len(patterns), flags=[flags] * len(patterns))
+        self._local = threading.local()
+
+    @staticmethod
+    def _on_match(*_):
+        return True  # stop at the first match
+
+    def search(self, text: str) -> bool:
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+        try:
+            self._db.scan(text.encode("utf-8"), match_event_handler=self._on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+# Group references (\N, (?P=name), (?(id)...)) would point at the wrong
+# group once patterns are joined into one alternation.
+_GROUP_REF = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+def _fuse_patterns(patterns: List[str]) -> Tuple[Any, ...]:
+    """
+    Compile patterns into a single matcher so one search tests every
+    branch: a Hyperscan database when hyperscan is installed and supports
+    the syntax, else one '(?:p1)|(?:p2)|...' regex. Invalid patterns are
+    dropped (the old skip-on-re.error behaviour). Patterns that refer to
+    their own groups are never fused, and if the rest cannot be fused
+    (e.g. a mid-pattern global flag) they are returned compiled
+    individually.
+    """
+    fusable = []
+    standalone = []
+    for pat in patterns:
+        try:
+            rx = re.compile(pat, _EV_FLAGS)
+        except re.error:
+            continue
+        if rx.groups and _GROUP_REF.search(pat):
+            standalone.append(rx)
+        else:
+            fusable.append(rx)
+    return _fuse_compiled(fusable) + tuple(standalone)
+
+# Constructs Hyperscan (PCRE) reads differently from Python re: \Z also
+# matches before a final newline, \v is any vertical whitespace (\n
+# included) rather than just VT, {,n} is not a quantifier, and [[:alpha:]]
+# is a POSIX class rather than a plain set. \s also differs (PCRE UCP does
+# not match \x1c-\x1f) but stays on Hyperscan: those control characters
+# are practically absent from HTML, and routing every \s pattern to re
+# would leave Hyperscan little to do.
+_HS_DIVERGENT = re.compile(r"\\Z|\\v|\{,|\[:")
+
+def _fuse_compiled(compiled: List["re.Pattern[str]"]) -> Tuple[Any, ...]:
+    if not compiled:
+        return ()
+    if hyperscan is not None:
+        hs_ok = [rx for rx in compiled if not _HS_DIVERGENT.search(rx.pattern)]
+        if hs_ok:
+            try:
+                matcher = _HsMatcher([rx.pattern for rx in hs_ok])
+            except hyperscan.error:
+                pass  # unsupported syntax (lookaround, empty matches, ...): use re
+            else:
+                rest = [rx for rx in compiled if _HS_DIVERGENT.search(rx.pattern)]
+                return (matcher,) + _fuse_re(rest)
+    return _fuse_re(compiled)
+
+def _fuse_re(compiled: List["re.Pattern[str]"]) -> Tuple[Any, ...]:
+    if len(compiled) <= 1:
+        return tuple(compiled)
+    try:
+        return (re.compile("|".join(f"(?:{rx.pattern})" for rx in compiled), _EV_FLAGS),)
+    except re.error:
+        return tuple(compiled)
+
+def _prepare_evidence(site: Dict[str, Any]):
+    """
+    Split evidence_regex into patterns fused and compiled once here
+    ('_ev_static') and username-templated ones ('_ev_user') fused and
+    compiled once per username on demand.
+    """
+    patterns = site.get("evidence_regex")
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    static: List[str] = []
+    templated: List[str] = []
+    for pat in patterns or []:
+        if not isinstance(pat, str):
+            continue
+        if any(ph in pat for ph in _USER_PLACEHOLDERS):
+            templated.append(pat)
+        else:
+            static.append(pat)
+    site["_ev_static"] = _fuse_patterns(static)
+    site["_ev_user"] = tuple(templated)
+
+@functools.lru_cache(maxsize=4096)
+def _compile_ev(patterns: Tuple[str, ...], user: str) -> Tuple[Any, ...]:
+    esc = re.escape(user)
+    return _fuse_patterns([p.replace("{user}", esc).replace("{!!}", esc) for p in patterns])
+
+_sites_raw = load_yaml("sites.yml", cache=True)
 sites: List[Dict[str, Any]] = normalize_sites(_sites_raw)
 header_cfg: Dict[str, Any] = load_yaml("headers.yml") or {}
 
@@ -137,121 +350,484 @@ header_cfg: Dict[str, Any] = load_yaml("headers.yml") or {}
 # -----------------------
 
 USE_COLOR = True
-def printc(rgb: Tuple[int,int,int], text: str):
-    if not USE_COLOR:
-        print(text, flush=True); return
-    r, g, b = rgb
-    print(f"\033[38;2;{r};{g};{b}m{text}\033[0m", flush=True)
-
 GREEN = (38, 182, 82)
 RED   = (250, 41, 41)
 YEL   = (255, 211, 0)
 
+_RESET = "\033[0m"
+_PREFIX: Dict[Tuple[int,int,int], str] = {
+    rgb: "\033[38;2;{};{};{}m".format(*rgb) for rgb in (GREEN, RED, YEL)
+}
+# Explicit flush every N lines; stdout is already line-buffered on a TTY
+_FLUSH_EVERY = 50
+_unflushed = 0
+
+def printc(rgb: Tuple[int,int,int], text: str):
+    global _unflushed
+    if USE_COLOR:
+        prefix = _PREFIX.get(rgb)
+        if prefix is None:
+            prefix = _PREFIX[rgb] = "\033[38;2;{};{};{}m".format(*rgb)
+        sys.stdout.write(prefix + text + _RESET + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    _unflushed += 1
+    if _unflushed >= _FLUSH_EVERY:
+        sys.stdout.flush()
+        _unflushed = 0
+
+# Upper bound for --threads; workers are I/O-bound, not CPU-bound
+MAX_THREADS = 256
+
 # -----------------------
 # HTTP Session factory
 # -----------------------
 
-def make_session(timeout: float, proxy: Optional[str]):
-    s = requests.Session()
-    retry = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
-        raise_on_status=False,
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retry))
-    s.mount("https://", HTTPAdapter(max_retries=retry))
-
+def _session_headers() -> Dict[str, str]:
+    # Same defaults requests used to add: compressed bodies, any content type
+    headers: Dict[str, str] = {"Accept-Encoding": "gzip, deflate", "Accept": "*/*"}
     base_headers = header_cfg.get("Base", {}) if isinstance(header_cfg, dict) else {}
     for k, v in base_headers.items():
-        s.headers[k] = v
+        headers[k] = v
+    headers["Connection"] = "keep-alive"
 
     uas = header_cfg.get("User-Agents") if isinstance(header_cfg, dict) else None
-    if uas: s.headers["User-Agent"] = random.choice(uas)
+    if uas: headers["User-Agent"] = random.choice(uas)
 
     langs = header_cfg.get("Accept-Languages") if isinstance(header_cfg, dict) else None
-    if langs: s.headers["Accept-Language"] = random.choice(langs)
+    if langs: headers["Accept-Language"] = random.choice(langs)
+    return headers
+
+def _charset(content_type: str) -> Optional[str]:
+    for part in content_type.split(";")[1:]:
+        key, _, value = part.strip().partition("=")
+        if key.lower() == "charset":
+            return value.strip("\"' ") or None
+    return None
 
-    if proxy:
-        s.proxies.update({"http": proxy, "https": proxy})
+class _PoolResponse:
+    """
+    Streamed urllib3 response exposing what fetch_page needs (status_code,
+    headers, encoding, iter_content, close).
+    """
+    # Unread bodies up to this size are drained so the keep-alive connection
+    # can be reused; larger ones are dropped with the connection.
+    _DRAIN_MAX = 65536
+
+    def __init__(self, resp, method: str = "GET"):
+        self._resp = resp
+        # HEAD/204/304 carry no body even when Content-Length or chunked
+        # framing describe the GET representation; always safe to drain.
+        self._bodyless = method == "HEAD" or resp.status in (204, 304)
+        self._eof = False
+        self.status_code = resp.status
+        self.headers = resp.headers
+        self.encoding = _charset(resp.headers.get("Content-Type", ""))
+
+    def iter_content(self, chunk_size: int):
+        yield from self._resp.stream(chunk_size, decode_content=True)
+        self._eof = True
+
+    def close(self):
+        r = self._resp
+        if self._bodyless:
+            length = 0
+        else:
+            try:
+                length = int(r.headers.get("Content-Length", "-1"))
+            except ValueError:
+                length = -1
+        try:
+            if self._eof or self._bodyless or 0 <= length <= self._DRAIN_MAX:
+                r.drain_conn()
+            else:
+                r.close()
+        except urllib3.exceptions.HTTPError:
+            r.close()
+        r.release_conn()
 
-    s.request_timeout = timeout
-    return s
+class _PoolSession:
+    """
+    Shared HTTP client over urllib3 pool managers, used instead of
+    requests.Session to skip its per-call overhead. Pool managers are
+    thread-safe; User-Agent/Accept-Language rotate per request rather than
+    being stored. Like requests it honours HTTP(S)_PROXY/NO_PROXY when no
+    --proxy is given, verifies TLS against certifi when installed, and
+    carries cookies set along a redirect chain.
+    """
+    MAX_REDIRECTS = 30
+
+    def __init__(self, timeout: float, proxy: Optional[str], thread_count: int = 32, num_pools: int = 10):
+        retry = Retry(
+            total=3,  # also caps errors with no per-kind counter (e.g. TLS failures)
+            connect=3,
+            read=3,
+            status=3,
+            redirect=False,  # redirects are followed in request()
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 504],
+            respect_retry_after_header=False,  # 429/503 + Retry-After are handled in fetch_page
+            allowed_methods=["GET", "HEAD"],
+            raise_on_status=False,
+        )
+        # One pool per host, each able to hold a keep-alive connection per worker
+        self._kw: Dict[str, Any] = dict(num_pools=max(num_pools, 10), maxsize=thread_count, block=False, retries=retry)
+        if certifi is not None:
+            self._kw.update(cert_reqs="CERT_REQUIRED", ca_certs=certifi.where())
+        self._direct = urllib3.PoolManager(**self._kw)
+        self._proxied: Dict[str, Any] = {}
+        self._proxied_lock = threading.Lock()
+        self._proxy = proxy
+        self._env_proxies = {} if proxy else getproxies()
+        if proxy:
+            self._proxy_manager(proxy)  # fail early if e.g. PySocks is missing
+        self.headers = _session_headers()
+        self.request_timeout = timeout
+
+    def _proxy_manager(self, proxy: str):
+        pm = self._proxied.get(proxy)
+        if pm is None:
+            with self._proxied_lock:
+                pm = self._proxied.get(proxy)
+                if pm is None:
+                    if proxy.lower().startswith("socks"):
+                        from urllib3.contrib.socks import SOCKSProxyManager
+                        pm = SOCKSProxyManager(proxy, **self._kw)
+                    else:
+                        pm = urllib3.ProxyManager(proxy, **self._kw)
+                    self._proxied[proxy] = pm
+        return pm
+
+    def _manager_for(self, url: str):
+        if self._proxy:
+            return self._proxy_manager(self._proxy)
+        if self._env_proxies:
+            proxy = self._env_proxies.get(url.partition(":")[0].lower()) or self._env_proxies.get("all")
+            if proxy and not proxy_bypass(urlparse(url).hostname or ""):
+                return self._proxy_manager(proxy)
+        return self._direct
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None,
+                allow_redirects: bool = True, stream: bool = False) -> _PoolResponse:
+        headers = _session_headers()
+        cookies: Dict[str, Dict[str, str]] = {}  # host -> cookies set during this chain
+        for _ in range(self.MAX_REDIRECTS + 1):
+            # The host is only parsed once a redirect has set cookies
+            host = (urlparse(url).hostname or "") if cookies else None
+            sent = headers
+            if host in cookies:
+                sent = dict(headers, Cookie="; ".join(f"{k}={v}" for k, v in cookies[host].items()))
+            resp = self._manager_for(url).request(method, url, headers=sent, timeout=timeout,
+                                                  redirect=False, preload_content=not stream)
+            location = resp.get_redirect_location() if allow_redirects else None
+            if not location:
+                return _PoolResponse(resp, method)
+            set_cookies = resp.headers.getlist("Set-Cookie")
+            if set_cookies and host is None:
+                host = urlparse(url).hostname or ""
+            for raw in set_cookies:
+                jar = SimpleCookie()
+                try:
+                    jar.load(raw)
+                except CookieError:
+                    continue
+                cookies.setdefault(host, {}).update((k, m.value) for k, m in jar.items())
+            resp.drain_conn()
+            resp.release_conn()
+            url = urljoin(url, location)
+        return _PoolResponse(resp, method)  # redirect limit reached: report the 3xx
+
+def make_session(timeout: float, proxy: Optional[str], thread_count: int = 32, num_pools: int = 10):
+    return _PoolSession(timeout=timeout, proxy=proxy, thread_count=thread_count, num_pools=num_pools)
+
+class _Http2Response:
+    """Wraps an httpx.Response in the same interface as _PoolResponse."""
+    def __init__(self, resp):
+        self._resp = resp
+        self.status_code = resp.status_code
+        self.headers = resp.headers
+        self.encoding = resp.charset_encoding
+
+    def iter_content(self, chunk_size: int):
+        yield from self._resp.iter_bytes(chunk_size)
+
+    def close(self):
+        self._resp.close()
+
+class _Http2ProxyRouter:
+    """
+    httpx transport that picks a proxy per request like
+    _PoolSession._manager_for: HTTP(S)_PROXY/ALL_PROXY unless NO_PROXY
+    matches the host. httpx ignores the environment once a transport is
+    passed in, so without this --http2 would connect directly. Redirect
+    hops go through handle_request too and are routed by their own host.
+    """
+    def __init__(self, proxies: Dict[str, str], make_transport: Callable[[Optional[str]], Any]):
+        self._proxies = proxies
+        self._make_transport = make_transport
+        self._transports: Dict[Optional[str], Any] = {}
+        self._lock = threading.Lock()
+
+    def _transport(self, proxy: Optional[str]):
+        transport = self._transports.get(proxy)
+        if transport is None:
+            with self._lock:
+                transport = self._transports.get(proxy)
+                if transport is None:
+                    transport = self._transports[proxy] = self._make_transport(proxy)
+        return transport
+
+    def handle_request(self, request):
+        proxy = self._proxies.get(request.url.scheme) or self._proxies.get("all")
+        if proxy and proxy_bypass(request.url.host):
+            proxy = None
+        return self._transport(proxy).handle_request(request)
+
+    def close(self):
+        for transport in self._transports.values():
+            transport.close()
+
+class _Http2Session:
+    """
+    _PoolSession stand-in over one httpx.Client with HTTP/2 enabled. The
+    client is thread-safe and is shared by all workers so concurrent
+    requests to a host multiplex over a single connection. Headers rotate
+    per request and env proxies apply, as in _PoolSession.
+    """
+    def __init__(self, timeout: float, proxy: Optional[str], thread_count: int = 32):
+        limits = httpx.Limits(max_connections=thread_count, max_keepalive_connections=thread_count)
+        def make_transport(proxy: Optional[str]):
+            return httpx.HTTPTransport(http2=True, retries=3, limits=limits, proxy=proxy)
+        env_proxies = {} if proxy else getproxies()
+        transport = _Http2ProxyRouter(env_proxies, make_transport) if env_proxies else make_transport(proxy)
+        self.headers = self._headers()
+        self.request_timeout = timeout
+        self._client = httpx.Client(transport=transport, timeout=timeout)
+
+    @staticmethod
+    def _headers() -> Dict[str, str]:
+        headers = _session_headers()
+        headers.pop("Connection", None)  # connection-specific; not allowed in HTTP/2
+        return headers
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None,
+                allow_redirects: bool = True, stream: bool = False) -> _Http2Response:
+        req = self._client.build_request(method, url, headers=self._headers(), timeout=timeout)
+        return _Http2Response(self._client.send(req, stream=stream, follow_redirects=allow_redirects))
+
+# Transport failures reported as "ERR: <type>" instead of a status code
+_FETCH_ERRORS: Tuple[type, ...] = (urllib3.exceptions.HTTPError,) + ((httpx.HTTPError,) if httpx else ())
 
 # -----------------------
 # Per-domain concurrency
 # -----------------------
 
 _domain_limits = defaultdict(lambda: 3)
-_domain_inflight = defaultdict(int)
 
-def _domain_guard(url: str):
-    dom = urlparse(url).netloc
-    while _domain_inflight[dom] >= _domain_limits[dom]:
-        time.sleep(0.02)
-    _domain_inflight[dom] += 1
-    return dom
-
-def _domain_release(dom: str):
-    _domain_inflight[dom] -= 1
-    if _domain_inflight[dom] < 0:
-        _domain_inflight[dom] = 0
+class _DomainLimiter:
+    """
+    Per-domain concurrency gate. The limit starts at _domain_limits[dom], is
+    halved (down to 1) whenever the host answers 429/503, and grows back by
+    one after every RECOVER_AFTER consecutive unthrottled responses, up to
+    the starting limit. retry_lock keeps at most one throttled retry in
+    flight per domain.
+    """
+    RECOVER_AFTER = 20
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.max_limit = limit
+        self.retry_lock = threading.Lock()
+        self._inflight = 0
+        self._ok_streak = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self._inflight >= self.limit:
+                self._cond.wait()
+            self._inflight += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify()
+
+    def throttle(self):
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self._ok_streak = 0
+
+    def record_ok(self):
+        with self._cond:
+            if self.limit >= self.max_limit:
+                return
+            self._ok_streak += 1
+            if self._ok_streak >= self.RECOVER_AFTER:
+                self._ok_streak = 0
+                self.limit += 1
+                self._cond.notify()
+
+_domain_limiters: Dict[str, _DomainLimiter] = {}
+_domain_limiters_lock = threading.Lock()
+
+def _domain_limiter(dom: str) -> _DomainLimiter:
+    lim = _domain_limiters.get(dom)
+    if lim is None:
+        with _domain_limiters_lock:
+            lim = _domain_limiters.get(dom)
+            if lim is None:
+                lim = _domain_limiters[dom] = _DomainLimiter(_domain_limits[dom])
+    return lim
+
+# Minimum spacing between requests to the same host. The first request to a
+# host goes out immediately; only repeat hits are delayed.
+_DOMAIN_MIN_INTERVAL = 0.15
+_domain_next_slot: Dict[str, float] = {}
+_domain_pace_lock = threading.Lock()
+
+def _domain_pace(dom: str):
+    with _domain_pace_lock:
+        now = perf_counter()
+        slot = max(now, _domain_next_slot.get(dom, now))
+        _domain_next_slot[dom] = slot + _DOMAIN_MIN_INTERVAL
+    if slot > now:
+        time.sleep(slot - now)
 
 # -----------------------
 # Core helpers
 # -----------------------
 
-def format_url(tmpl: str, username: str) -> str:
-    return tmpl.replace("{!!}", username).replace("{user}", username)
+def site_url(site: Dict[str, Any], username: str) -> str:
+    static = site["_url_static"]
+    return static if static is not None else site["_fmt"].format(username)
+
+def _read_text(resp: _PoolResponse, max_bytes: int) -> str:
+    """
+    Decode at most max_bytes (0 = no limit) of a streamed body. Evidence
+    markers sit near the top of a page, so the rest is never downloaded.
+    """
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=16384):
+        buf += chunk
+        if max_bytes and len(buf) >= max_bytes:
+            del buf[max_bytes:]
+            break
+    try:
+        return buf.decode(resp.encoding or "utf-8", errors="replace")
+    except LookupError:
+        return buf.decode("utf-8", errors="replace")
+
+# Rate-limit handling: 429/503 shrink the host's concurrency and are retried
+# once after Retry-After (or the default), unless the host asks for longer.
+_THROTTLE_STATUSES = (429, 503)
+_RETRY_AFTER_DEFAULT = 1.0
+_RETRY_AFTER_MAX = 30.0
+
+def _retry_after(resp) -> float:
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return _RETRY_AFTER_DEFAULT
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return _RETRY_AFTER_DEFAULT
+
+def _send(session: _PoolSession, url: str, method: str, max_bytes: int, limiter: _DomainLimiter):
+    text = ""
+    with limiter:
+        resp = session.request(method, url, timeout=session.request_timeout,
+                               allow_redirects=True, stream=True)
+        try:
+            if method == "GET" and resp.status_code == 200:
+                text = _read_text(resp, max_bytes)
+        finally:
+            resp.close()
+    return resp, text
 
-def fetch_page(session: requests.Session, url: str):
-    time.sleep(random.uniform(0.08, 0.25))  # jitter
+def fetch_page(session: _PoolSession, url: str, dom: str, method: str = "GET", max_bytes: int = 0):
+    """
+    Return (response-or-exception, text, ms). `dom` is the site's cached
+    netloc, used for pacing and concurrency limits. The body is only read
+    for a 200 GET; everything else is closed without downloading it.
+    """
+    _domain_pace(dom)
+    limiter = _domain_limiter(dom)
     start = perf_counter()
-    dom = _domain_guard(url)
     try:
-        resp = session.get(url, timeout=session.request_timeout, allow_redirects=True)
+        resp, text = _send(session, url, method, max_bytes, limiter)
+        if resp.status_code in _THROTTLE_STATUSES:
+            limiter.throttle()
+            delay = _retry_after(resp)
+            if delay <= _RETRY_AFTER_MAX:
+                with limiter.retry_lock:
+                    time.sleep(delay)
+                    _domain_pace(dom)
+                    resp, text = _send(session, url, method, max_bytes, limiter)
+                if resp.status_code in _THROTTLE_STATUSES:
+                    limiter.throttle()
+                else:
+                    limiter.record_ok()
+        else:
+            limiter.record_ok()
         ms = int((perf_counter() - start) * 1000.0)
-        return resp, ms
-    except requests.RequestException as e:
+        return resp, text, ms
+    except _FETCH_ERRORS as e:
+        if isinstance(e, urllib3.exceptions.MaxRetryError) and e.reason is not None:
+            e = e.reason  # report the underlying failure, e.g. NewConnectionError
         ms = int((perf_counter() - start) * 1000.0)
-        return e, ms
-    finally:
-        _domain_release(dom)
+        return e, "", ms
 
-def evidence_match(text: str, patterns: Optional[List[str]], username: str) -> bool:
-    if not patterns:
+def evidence_match(text: str, site: Dict[str, Any], username: str) -> bool:
+    if not site.get("evidence_regex"):
         return True
-    if isinstance(patterns, str):
-        patterns = [patterns]
-    for pat in patterns:
-        pat = pat.replace("{user}", re.escape(username)).replace("{!!}", re.escape(username))
-        try:
-            if re.search(pat, text or "", flags=re.I | re.M):
+    text = text or ""
+    for rx in site["_ev_static"]:
+        if rx.search(text):
+            return True
+    if site["_ev_user"]:
+        for rx in _compile_ev(site["_ev_user"], username):
+            if rx.search(text):
                 return True
-        except re.error:
-            continue
     return False
 
-def scout_page(session, username: str, site: Dict[str, Any], ordinal: int, total: int, evidence_only: bool):
+def scout_page(session: _PoolSession, username: str, site: Dict[str, Any],
+               ordinal: int, total: int, evidence_only: bool, evidence_bytes: int = 65536):
     """
     Perform the request and RETURN the formatted line & metadata.
     Printing happens in-order in the main thread.
     """
     name = site.get("name", "site")
-    url = format_url(site["url"], username)
+    url = site_url(site, username)
 
-    res, elapsed = fetch_page(session, url)
+    patterns = site.get("evidence_regex")
+
+    # Sites without evidence_regex are decided by status alone, so probe them
+    # with HEAD. Sites with patterns go straight to GET: a 200 from HEAD would
+    # need the body anyway to mark the hit verified.
+    res, text, elapsed = None, "", 0
+    if not patterns:
+        res, text, elapsed = fetch_page(session, url, site["_netloc"], method="HEAD")
+        if not isinstance(res, Exception) and res.status_code in (405, 501):
+            res = None  # HEAD not supported here; fall back to GET
+    if res is None:
+        res, text, ms = fetch_page(session, url, site["_netloc"], max_bytes=evidence_bytes)
+        elapsed += ms
     color = YEL
     status = "ERR"
     hit200 = False
     hit_verified = False
 
-    if isinstance(res, requests.Response):
+    if not isinstance(res, Exception):
         status = str(res.status_code)
         if res.status_code == 200:
             hit200 = True
-            if evidence_match(res.text, site.get("evidence_regex"), username):
+            if evidence_match(text, site, username):
                 hit_verified = True
                 color = GREEN
             else:
@@ -286,17 +862,23 @@ def scout_page(session, username: str, site: Dict[str, Any], ordinal: int, total
 # -----------------------
 
 def export_jsonl(filepath: str, rows: List[Dict[str, Any]]):
+    if orjson is not None:
+        data = b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in rows)
+        with open(filepath, "wb") as f:
+            f.write(data)
+        return
+    lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in rows]
     with open(filepath, "w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        f.writelines(lines)
 
 def export_csv(filepath: str, rows: List[Dict[str, Any]]):
     fields = ["site", "username", "url", "status", "ms", "hit200", "hit"]
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=fields)
+    w.writeheader()
+    w.writerows({k: r.get(k) for k in fields} for r in rows)
     with open(filepath, "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k) for k in fields})
+        f.write(buf.getvalue())
 
 # -----------------------
 # Streaming links helpers
@@ -309,29 +891,105 @@ def _ensure_parent(path: str):
     if d and not os.path.exists(d):
         os.makedirs(d, exist_ok=True)
 
-def _load_existing_lines(path: str) -> set:
+class _LinkSeen:
+    """
+    De-dup state for --links-out, which grows across runs. Lines are kept
+    as 8-byte BLAKE2b digests instead of full URL strings (collision odds
+    ~n^2/2^65, negligible for any realistic hits file).
+    """
+    def __init__(self):
+        self._digests: Set[bytes] = set()
+
+    @staticmethod
+    def _key(line: str) -> bytes:
+        return hashlib.blake2b(line.encode("utf-8"), digest_size=8).digest()
+
+    def add(self, line: str):
+        self._digests.add(self._key(line))
+
+    def __contains__(self, line: str) -> bool:
+        return self._key(line) in self._digests
+
+def _load_existing_lines(path: str) -> _LinkSeen:
+    seen = _LinkSeen()
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return {line.rstrip("\n") for line in f if line.strip()}
+            for line in f:
+                if line.strip():
+                    seen.add(line.rstrip("\n"))
     except FileNotFoundError:
-        return set()
+        pass
+    return seen
 
-def _append_line_safe(fh, line: str, seen: set):
+def _append_line_safe(fh, line: str, seen: _LinkSeen):
     if line in seen:
         return False
     with _link_lock:
         if line in seen:
             return False
         fh.write(line + "\n")
-        fh.flush()
-        os.fsync(fh.fileno())
         seen.add(line)
     return True
 
+def _fsync_links(fh):
+    # Only the flush needs the lock; fsync works on the fd and can take a
+    # while, so writers aren't held up behind it.
+    with _link_lock:
+        fh.flush()
+    os.fsync(fh.fileno())
+
+def _start_links_fsync(fh, interval: float) -> Tuple[threading.Event, threading.Thread]:
+    """
+    Sync the links file every `interval` seconds in the background instead of
+    on every hit; scout() does one last fsync before closing the file.
+    """
+    stop = threading.Event()
+    def loop():
+        while not stop.wait(interval):
+            _fsync_links(fh)
+    t = threading.Thread(target=loop, name="links-fsync", daemon=True)
+    t.start()
+    return stop, t
+
 # -----------------------
 # Runner
 # -----------------------
 
+def _map_bounded(ex: ThreadPoolExecutor, fn: Callable[[Any], Any], items: Iterable[Any],
+                 window: int, max_buffered: int) -> Iterator[Any]:
+    """
+    Like ex.map (results in submission order), but pulls items lazily and
+    keeps at most `window` tasks pending. Results that finish before an
+    earlier, slower task wait in a reorder buffer; new work is only held
+    back once that buffer reaches `max_buffered`, so a single slow host
+    doesn't idle the other workers.
+    """
+    pending: Set[Future] = set()
+    order: Dict[Future, int] = {}
+    ready: Dict[int, Any] = {}
+    next_out = 0
+
+    def collect():
+        nonlocal pending
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            ready[order.pop(fut)] = fut.result()
+
+    for idx, item in enumerate(items):
+        while len(pending) >= window or (pending and len(ready) >= max_buffered):
+            collect()
+            while next_out in ready:
+                yield ready.pop(next_out)
+                next_out += 1
+        fut = ex.submit(fn, item)
+        order[fut] = idx
+        pending.add(fut)
+    while pending:
+        collect()
+        while next_out in ready:
+            yield ready.pop(next_out)
+            next_out += 1
+
 def read_user_list(path: str) -> List[str]:
     with open(path, "r", encoding="utf-8") as f:
         return [line.strip() for line in f if line.strip()]
@@ -346,9 +1004,10 @@ def scout(
     csv_out: Optional[str],
     evidence_only: bool,
     links_out: Optional[str],
+    evidence_bytes: int = 65536,
+    links_fsync_interval: float = 2.0,
+    http2: bool = False,
 ):
-    session = make_session(timeout=timeout, proxy=proxy)
-
     # filter sites by --only (case-insensitive)
     if only_sites:
         only_lc = {s.lower() for s in only_sites}
@@ -359,67 +1018,75 @@ def scout(
     else:
         target_sites = sites
 
-    cpu = os.cpu_count() or 1
-    max_threads = max(1, cpu * 5)
-    thread_count = min(max(1, threads), max_threads)
+    # Workers spend nearly all their time blocked on sockets, so the pool is
+    # sized by the requested concurrency rather than by CPU count.
+    thread_count = min(max(1, threads), MAX_THREADS)
+
+    # One thread-safe client is shared by all workers; with --http2 requests
+    # to a host also multiplex over a single connection.
+    session = None
+    if http2:
+        if httpx is None:
+            print("Warning: --http2 needs httpx[http2] installed. Falling back to HTTP/1.1.")
+        else:
+            try:
+                session = _Http2Session(timeout=timeout, proxy=proxy, thread_count=thread_count)
+            except ImportError as e:
+                print(f"Warning: --http2 unavailable ({e}). Falling back to HTTP/1.1.")
+    if session is None:
+        num_pools = len({s["_netloc"] for s in target_sites})
+        try:
+            session = make_session(timeout=timeout, proxy=proxy, thread_count=thread_count, num_pools=num_pools)
+        except ImportError as e:
+            print(f"Error, proxy {proxy} needs extra packages (pip install pysocks): {e}")
+            sys.exit(1)
 
     print_banner()
     print_howto()
     print("Scouting user(s):", usernames)
     print("Page count:", len(target_sites))
     print("Maximum threads:", thread_count)
-    print("Headers:")
+    print("Headers (sample; User-Agent and Accept-Language rotate per request):")
     print("========================================")
     print(safe_dump(dict(session.headers), indent=2).strip())
     print("========================================")
 
-    tasks: List[Tuple[str, Dict[str, Any]]] = [(user, site) for user in usernames for site in target_sites]
-    total = len(tasks)
+    # Streamed (user, site) pairs; never materialized for big userlists
+    tasks = enumerate(itertools.product(usernames, target_sites), start=1)
+    total = len(usernames) * len(target_sites)
 
     hits_to_save: List[Dict[str, Any]] = []
-    futures = []
     start = perf_counter()
 
     link_fh = None
-    link_seen = set()
+    link_seen = _LinkSeen()
+    link_sync = None
     if links_out:
         _ensure_parent(links_out)
         link_seen = _load_existing_lines(links_out)
-        link_fh = open(links_out, "a", encoding="utf-8")
+        link_fh = open(links_out, "a", encoding="utf-8", buffering=1)
+        if links_fsync_interval > 0:
+            link_sync = _start_links_fsync(link_fh, links_fsync_interval)
 
     try:
-        # Submit all tasks
+        def run(task: Tuple[int, Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+            idx, (user, site) = task
+            try:
+                return scout_page(session, user, site, idx, total, evidence_only, evidence_bytes)
+            except Exception as e:
+                return {"line": f"[ ERR ] (exception) {e}", "color": RED, "save": False}
+
+        # Results come back in submission order, so lines print in order as
+        # soon as the next one is ready; only a small window is in flight.
         with ThreadPoolExecutor(max_workers=thread_count) as ex:
-            for idx, (user, site) in enumerate(tasks, start=1):
-                futures.append(ex.submit(scout_page, session, user, site, idx, total, evidence_only))
-
-            # Ordered printer: buffer results and print in ordinal order
-            results_buffer: Dict[int, Dict[str, Any]] = {}
-            next_to_print = 1
-
-            for fut in as_completed(futures):
-                try:
-                    result = fut.result()
-                except Exception as e:
-                    printc(RED, f"[ ERR ] (exception) {e}")
-                    continue
-
-                results_buffer[result["ordinal"]] = result
-
-                # Print any consecutive ready results in order
-                while next_to_print in results_buffer:
-                    r = results_buffer.pop(next_to_print)
-
-                    # in-order console line
-                    printc(r["color"], r["line"])
-
-                    # handle saving
-                    if r.get("save"):
-                        hits_to_save.append(r)
-                        if link_fh:
-                            _append_line_safe(link_fh, r["url"], link_seen)
+            for r in _map_bounded(ex, run, tasks, window=2 * thread_count,
+                                  max_buffered=16 * thread_count):
+                printc(r["color"], r["line"])
 
-                    next_to_print += 1
+                if r.get("save"):
+                    hits_to_save.append(r)
+                    if link_fh:
+                        _append_line_safe(link_fh, r["url"], link_seen)
 
         dur = round(perf_counter() - start, 2)
         print("========================================")
@@ -435,7 +1102,13 @@ def scout(
         if link_fh:
             printc((110, 200, 255), f"Saved links -> {links_out}")
     finally:
+        sys.stdout.flush()
+        if link_sync:
+            stop, t = link_sync
+            stop.set()
+            t.join()
         if link_fh:
+            _fsync_links(link_fh)
             link_fh.close()
 
 # -----------------------
@@ -446,7 +1119,7 @@ def parse_args():
     ap = argparse.ArgumentParser(description="Scout users on popular websites.")
     ap.add_argument("usernames", nargs="*", help="One or more usernames")
     ap.add_argument("--userlist", type=str, help="File with one username per line")
-    ap.add_argument("--threads", type=int, default=32, help="Max worker threads")
+    ap.add_argument("--threads", type=int, default=32, help=f"Max worker threads (capped at {MAX_THREADS})")
     ap.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout seconds")
     ap.add_argument("--proxy", type=str, help="HTTP/SOCKS proxy (e.g., socks5://127.0.0.1:9050)")
     ap.add_argument("--only", type=str, help="Comma-separated site names to include")
@@ -454,12 +1127,18 @@ def parse_args():
     ap.add_argument("--csv-out", type=str, help="Write positives to CSV file (end-of-run)")
     ap.add_argument("--links-out", type=str, default="hits.txt",
                     help="Append-only: write each positive URL immediately (default: hits.txt)")
+    ap.add_argument("--links-fsync-interval", type=float, default=2.0,
+                    help="Seconds between fsyncs of --links-out (0 = only at end of run)")
     mode = ap.add_mutually_exclusive_group()
     mode.add_argument("--evidence-only", dest="evidence_only", action="store_true",
                       help="Only save when evidence_regex matches (default)")
     mode.add_argument("--any-200", dest="evidence_only", action="store_false",
                       help="Count any HTTP 200 as a hit (ignore evidence_regex)")
     ap.set_defaults(evidence_only=True)
+    ap.add_argument("--evidence-bytes", type=int, default=65536,
+                    help="Max bytes of a page body scanned for evidence_regex (0 = whole page)")
+    ap.add_argument("--http2", action="store_true",
+                    help="Use HTTP/2 via httpx, multiplexing requests per host (needs httpx[http2])")
     ap.add_argument("--no-color", action="store_true", help="Disable ANSI colors")
     ap.add_argument("--count", action="store_true", help="Print site count and exit")
     ap.add_argument("--no-howto", action="store_true", help="Do not print the how-to guide at start")
@@ -509,6 +1188,9 @@ def main():
         csv_out=args.csv_out,
         evidence_only=args.evidence_only,
         links_out=args.links_out,
+        evidence_bytes=max(0, args.evidence_bytes),
+        links_fsync_interval=args.links_fsync_interval,
+        http2=args.http2,
     )
 
 if __name__ == "__main__":